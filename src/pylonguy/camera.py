@@ -14,6 +14,7 @@ class Camera:
     def __init__(self):
         self.device = None
         self._is_grabbing = False
+        self._nodes = {}  # parameter name -> node handle (None if unsupported)
 
     @staticmethod
     def enumerate_cameras() -> list:
@@ -50,6 +51,7 @@ class Camera:
             log.debug(f"Camera - Found {len(devices)} camera(s)")
 
             self.device = pylon.InstantCamera(tlf.CreateDevice(devices[camera_index]))
+            self._nodes = {}
             self.device.Open()
 
             # Get device info
@@ -98,12 +100,26 @@ class Camera:
             except Exception as e:
                 log.debug(f"Camera - Error during close: {e}")
             self.device = None
+            self._nodes = {}
+
+    def _node(self, param_name: str):
+        """Parameter node, looked up once per opened camera"""
+        try:
+            return self._nodes[param_name]
+        except KeyError:
+            pass
+        try:
+            node = getattr(self.device, param_name)
+        except Exception:
+            node = None
+        self._nodes[param_name] = node
+        return node
 
     def set_parameter(self, param_name: str, value: Any) -> bool:
         """General setter for any camera parameter"""
         try:
-            if hasattr(self.device, param_name):
-                param = getattr(self.device, param_name)
+            param = self._node(param_name)
+            if param is not None:
                 if hasattr(param, "SetValue"):
                     param.SetValue(value)
                     log.debug(f"Camera - Set {param_name} = {value}")
@@ -119,8 +135,8 @@ class Camera:
         """
         result = {}
         try:
-            if hasattr(self.device, param_name):
-                param = getattr(self.device, param_name)
+            param = self._node(param_name)
+            if param is not None:
                 if hasattr(param, "Value"):
                     result["value"] = param.Value
                     if value_only:
@@ -138,11 +154,12 @@ class Camera:
         return result
 
     def apply_settings(self, settings: Dict) -> bool:
-        """Apply multiple settings at once"""
+        """Apply multiple settings at once, True only if every one was accepted"""
         if not self.device or settings is None:
             return False
 
         was_grabbing = self._is_grabbing
+        applied = True
 
         try:
             # Stop grabbing if active
@@ -151,7 +168,8 @@ class Camera:
 
             # Apply all settings
             for k, v in settings.items():
-                self.set_parameter(k, v)
+                if not self.set_parameter(k, v):
+                    applied = False
 
         except Exception as e:
             log.error(f"Configuration failed: {e}")
@@ -164,7 +182,8 @@ class Camera:
                     self.start_grabbing()
                 except Exception as e:
                     log.debug(f"Camera - Could not restart grabbing: {e}")
-            return True
+
+        return applied
 
     def get_settings(self, params: List[str]) -> Dict:
         """Get multiple parameters at once"""
@@ -224,7 +243,9 @@ class Camera:
 
     def grab_frame(self, timeout_ms: int = 5) -> Optional[np.ndarray]:
         """Grab single frame"""
-        if not self.device or not self.device.IsGrabbing():
+        # Tracked flag instead of an SDK IsGrabbing() call on every grab;
+        # if the device stops on its own, RetrieveResult raises and we return None
+        if not self.device or not self._is_grabbing:
             return None
 
         try:
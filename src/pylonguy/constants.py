@@ -6,12 +6,38 @@ MAX_OFFSET_Y = 3072
 MIN_ROI_WIDTH = 16
 MIN_ROI_HEIGHT = 16
 
+# Camera parameters queried on connect
+LIMIT_PARAMS = (
+    "Width",
+    "Height",
+    "ExposureTime",
+    "Gain",
+    "AcquisitionFrameRate",
+)
+OPTIONAL_PARAMS = (
+    "SensorReadoutMode",
+    "BinningHorizontal",
+    "BinningVertical",
+    "AcquisitionFrameRate",
+    "DeviceLinkThroughputLimit",
+)
+
 # Timing intervals
 CAMERA_APPLY_TIMEOUT = 0.05  # seconds
 FPS_UPDATE_INTERVAL_MS = 200
-FPS_RESET_INTERVAL = 5.0  # seconds
+FPS_SMOOTHING = 0.7  # weight of the previous estimate
 STATS_UPDATE_INTERVAL = 0.2  # seconds
 SIGNAL_TIMER_INTERVAL_MS = 100
+SELECTION_REDRAW_INTERVAL_MS = 16  # ~60 Hz
+PREVIEW_MAX_FPS = 60  # frames faster than the display are dropped
+LOG_FLUSH_INTERVAL_MS = 50
+
+# Log
+LOG_MAX_LINES = 100_000  # kept for saving
+LOG_MAX_BLOCKS = 5000  # kept in the view
+
+# Capture
+CAPTURE_PNG_QUALITY = 60  # Qt maps this to zlib level 3
 
 # Threading
 WRITER_QUEUE_SIZE = 10000
@@ -19,5 +45,8 @@ WRITER_THREAD_TIMEOUT = 60  # seconds
 QUEUE_GET_TIMEOUT = 0.1  # seconds
 LIMIT_CHECK_INTERVAL = 100  # frames
 
+# Frames at least this large use the parallel numba kernels
+PARALLEL_MIN_PIXELS = 1 << 20
+
 # Slider configuration
 OFFSET_SLIDER_STEP = 16
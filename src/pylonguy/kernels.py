@@ -0,0 +1,55 @@
+"""Kernels module - per-frame pixel conversions with optional numba acceleration"""
+
+import re
+import numpy as np
+import logging
+
+from .constants import PARALLEL_MIN_PIXELS
+
+log = logging.getLogger("pylonguy")
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _shift_rows(src, dst, shift):
+        """Row-parallel right shift with narrowing store"""
+        for i in prange(src.shape[0]):
+            for j in range(src.shape[1]):
+                dst[i, j] = src[i, j] >> shift
+
+
+def shift_to_u8(src: np.ndarray, dst: np.ndarray, shift: int) -> np.ndarray:
+    """Right-shift a 16-bit frame into a preallocated 8-bit buffer"""
+    if njit is not None and src.ndim == 2 and src.size >= PARALLEL_MIN_PIXELS:
+        _shift_rows(src, dst, shift)
+    else:
+        np.right_shift(src, shift, out=dst, casting="unsafe")
+    return dst
+
+
+def pixel_bit_depth(pixel_format: str) -> int:
+    """Significant bits per pixel for a GenICam pixel format name (Mono10p -> 10)"""
+    match = re.search(r"(\d+)", pixel_format or "")
+    return int(match.group(1)) if match else 8
+
+
+def u8_shift(bit_depth: int) -> int:
+    """Right shift keeping the top 8 significant bits of a uint16 frame"""
+    return (bit_depth if 8 < bit_depth <= 16 else 16) - 8
+
+
+def warmup():
+    """Compile the numba kernels ahead of the first frame"""
+    if njit is None:
+        return
+    try:
+        _shift_rows(np.zeros((2, 2), np.uint16), np.empty((2, 2), np.uint8), 8)
+        log.debug("Kernels - numba kernels compiled")
+    except Exception as e:
+        log.debug(f"Kernels - numba warmup failed: {e}")
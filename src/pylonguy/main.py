@@ -7,19 +7,25 @@ import time
 import logging
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
 import dropletui as ui
 from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon, QImage
 from PySide6.QtWidgets import QMessageBox
 
+from . import kernels
 from .camera import Camera
 from .ui import MainWindow
 from .thread import CameraThread
 from .worker import VideoWorker, WaterfallWorker
 from .constants import (
     CAMERA_APPLY_TIMEOUT,
+    CAPTURE_PNG_QUALITY,
+    LIMIT_PARAMS,
+    OPTIONAL_PARAMS,
     FPS_UPDATE_INTERVAL_MS,
-    FPS_RESET_INTERVAL,
+    FPS_SMOOTHING,
     SIGNAL_TIMER_INTERVAL_MS,
     MAX_OFFSET_X,
     MAX_OFFSET_Y,
@@ -42,15 +48,18 @@ class PylonApp:
         self.thread = None
         self.window = MainWindow()
         self.last_frame = None
+        self.pixel_bits = 8  # significant bits of the current pixel format
+        self.pixel_bgr = False  # colour frames arrive in BGR order
         self.current_selection = None
         self.ui_handler = None
         self.waterfall_mode = False
         self.timeout = CAMERA_APPLY_TIMEOUT
         self.missing_deps = missing_deps or []
+        self._last_applied = None
+        self._save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture")
 
         # FPS estimation variables
-        self.fps_frame_count = 0
-        self.fps_start_time = None
+        self.fps_last = None  # (monotonic time, thread grab count) of last estimate
         self.estimated_fps = 0.0
 
         self._connect_signals()
@@ -69,6 +78,9 @@ class PylonApp:
         self.fps_timer.timeout.connect(self._update_fps)
         self.fps_timer.start(FPS_UPDATE_INTERVAL_MS)
 
+        # Compile pixel kernels in the background so the first frame isn't stalled
+        Thread(target=kernels.warmup, daemon=True).start()
+
         log.info("Application started")
 
     def _require_camera(self) -> bool:
@@ -207,20 +219,25 @@ class PylonApp:
 
             # If camera doesn't provide FPS, estimate it
             if fps == 0.0:
-                # Calculate FPS from frame count and elapsed time
-                if self.fps_start_time:
-                    elapsed = time.time() - self.fps_start_time
-                    if elapsed > 0:
-                        self.estimated_fps = self.fps_frame_count / elapsed
-                        fps = self.estimated_fps
-
-                        # Reset counter every 5 seconds to get fresh estimates
-                        if elapsed > FPS_RESET_INTERVAL:
-                            self.fps_frame_count = 0
-                            self.fps_start_time = time.time()
+                fps = self._estimate_fps()
 
             self.window.preview.update_status(fps=fps)
 
+    def _estimate_fps(self) -> float:
+        """Smoothed grab rate from the acquisition thread's frame counter"""
+        now = time.monotonic()
+        count = self.thread.grab_count
+        if self.fps_last is not None:
+            last_time, last_count = self.fps_last
+            elapsed = now - last_time
+            if elapsed > 0:
+                rate = (count - last_count) / elapsed
+                if self.estimated_fps:
+                    rate += FPS_SMOOTHING * (self.estimated_fps - rate)
+                self.estimated_fps = rate
+        self.fps_last = (now, count)
+        return self.estimated_fps
+
     def _display_frame(self, frame):
         """Display frame in preview"""
         if frame is not None:
@@ -237,13 +254,6 @@ class PylonApp:
                         True, width, settings["roi"]["height"]
                     )
 
-            # Count frames for FPS estimation
-            if self.fps_start_time is None:
-                self.fps_start_time = time.time()
-                self.fps_frame_count = 0
-            else:
-                self.fps_frame_count += 1
-
             # Signal thread that frame was processed
             if self.thread:
                 self.thread.frame_processed()
@@ -295,8 +305,7 @@ class PylonApp:
             return
 
         # Reset FPS estimation
-        self.fps_frame_count = 0
-        self.fps_start_time = None
+        self.fps_last = None
         self.estimated_fps = 0.0
 
         self.thread = CameraThread(self.camera, waterfall_mode=self.waterfall_mode)
@@ -304,7 +313,15 @@ class PylonApp:
         self.thread.stats_update.connect(self._update_stats)
         self.thread.recording_stopped.connect(self._on_recording_stopped)
 
+        pixel_format = self.camera.get_parameter("PixelFormat", value_only=True)
+        pixel_format = pixel_format.get("value", "")
+        self.pixel_bits = kernels.pixel_bit_depth(pixel_format)
+        self.pixel_bgr = pixel_format.startswith("BGR")
+        self.window.preview.set_pixel_format(pixel_format)
+
+        # A preview-off recording may have ended via stop_live/disconnect
         self.thread.set_preview_enabled(True)
+        self.window.preview.set_preview_enabled(True)
         self.thread.start()
 
         self.window.preview.btn_live.setText("Stop Live")
@@ -320,8 +337,7 @@ class PylonApp:
             self.thread = None
 
         # Reset FPS estimation
-        self.fps_frame_count = 0
-        self.fps_start_time = None
+        self.fps_last = None
         self.estimated_fps = 0.0
 
         self.window.preview.btn_live.setText("Start Live")
@@ -340,16 +356,11 @@ class PylonApp:
             return
 
         if self.camera.open(camera_index, apply_defaults=True):
+            # Fresh camera state, nothing has been applied yet
+            self._last_applied = None
+
             # Update UI parameter limits from camera
-            params_to_update = [
-                "Width",
-                "Height",
-                "ExposureTime",
-                "Gain",
-                "AcquisitionFrameRate",
-            ]
-
-            for param in params_to_update:
+            for param in LIMIT_PARAMS:
                 info = self.camera.get_parameter(param)
                 if info:
                     self.window.settings.update_parameter_limits(
@@ -359,32 +370,21 @@ class PylonApp:
                         self.window.settings.set_parameter_value(param, info["value"])
 
             # Check for availability of optional parameters
-            optional_params = [
-                "SensorReadoutMode",
-                "BinningHorizontal",
-                "BinningVertical",
-                "AcquisitionFrameRate",
-                "DeviceLinkThroughputLimit",
-            ]
-
-            for param in optional_params:
+            for param in OPTIONAL_PARAMS:
                 info = self.camera.get_parameter(param)
                 if not info or "value" not in info:
                     self.window.settings.disable_parameter(param)
-                else:
-                    if param == "SensorReadoutMode" and "symbolics" in info:
-                        self.window.settings.update_parameter_limits(
-                            param, options=info["symbolics"]
-                        )
+                elif "symbolics" in info:
+                    self.window.settings.update_parameter_limits(
+                        param, options=info["symbolics"]
+                    )
 
             # Check for pixel format options
             pf_info = self.camera.get_parameter("PixelFormat")
             if pf_info and "symbolics" in pf_info:
-                options = [fmt for fmt in pf_info["symbolics"]]
-                if options:
-                    self.window.settings.update_parameter_limits(
-                        "PixelFormat", options=options
-                    )
+                self.window.settings.update_parameter_limits(
+                    "PixelFormat", options=pf_info["symbolics"]
+                )
 
             # Update slider ranges based on camera capabilities
             offset_x_info = self.camera.get_parameter("OffsetX")
@@ -435,87 +435,96 @@ class PylonApp:
         """Disconnect camera"""
         self.stop_live()
         self.camera.close()
+        self._last_applied = None
 
         self.window.settings.btn_connect.setEnabled(True)
         self.window.settings.btn_disconnect.setEnabled(False)
 
         log.info("Camera disconnected")
 
+    def _build_camera_settings(self, settings: dict) -> dict:
+        """Translate UI settings into camera parameter writes"""
+        cam_settings = {}
+
+        # ROI settings - handle in correct order
+        cam_settings["Width"] = settings["roi"]["width"]
+        cam_settings["Height"] = 1 if self.waterfall_mode else settings["roi"]["height"]
+        cam_settings["OffsetX"] = self._snap_roi_offset(settings["roi"]["offset_x"])
+        cam_settings["OffsetY"] = self._snap_roi_offset(settings["roi"]["offset_y"])
+
+        # Only apply binning if supported
+        if self.window.settings.binning_horizontal.isEnabled():
+            cam_settings["BinningHorizontal"] = settings["roi"]["binning_h"]
+            cam_settings["BinningVertical"] = settings["roi"]["binning_v"]
+
+        # Acquisition settings
+        cam_settings["ExposureTime"] = settings["acquisition"]["exposure"]
+        cam_settings["Gain"] = settings["acquisition"]["gain"]
+        cam_settings["PixelFormat"] = settings["acquisition"]["pixel_format"]
+
+        # Only apply sensor mode if supported
+        if (
+            settings["acquisition"]["sensor_mode"]
+            and self.window.settings.sensor_mode.isEnabled()
+        ):
+            cam_settings["SensorReadoutMode"] = settings["acquisition"]["sensor_mode"]
+
+        # Frame rate settings - only if supported
+        if self.window.settings.framerate_enable.isEnabled():
+            if settings["framerate"]["enabled"]:
+                cam_settings["AcquisitionFrameRateEnable"] = True
+                cam_settings["AcquisitionFrameRate"] = settings["framerate"]["fps"]
+            else:
+                cam_settings["AcquisitionFrameRateEnable"] = False
+
+        # Throughput settings - only if supported
+        if self.window.settings.throughput_enable.isEnabled():
+            if settings["framerate"]["throughput_enabled"]:
+                cam_settings["DeviceLinkThroughputLimitMode"] = "On"
+                cam_settings["DeviceLinkThroughputLimit"] = int(
+                    settings["framerate"]["throughput_limit"] * 1000000
+                )
+            else:
+                cam_settings["DeviceLinkThroughputLimitMode"] = "Off"
+
+        return cam_settings
+
     def apply_camera_settings(self):
         """Apply settings to camera"""
         if not self.camera.device:
             return
 
+        if self.thread and self.thread.isRunning() and self.thread.recording:
+            log.warning("Cannot apply settings while recording")
+            return
+
+        settings = self.window.settings.get_settings()
+        cam_settings = self._build_camera_settings(settings)
+
+        # Skip the stop/apply/restart cycle if nothing effectively changed
+        snapshot = (self.waterfall_mode, settings["roi"], cam_settings)
+        if snapshot == self._last_applied:
+            log.debug("Camera settings unchanged, skipping apply")
+            return
+
         # Stop preview if running
         was_live = False
         if self.thread and self.thread.isRunning():
-            if self.thread.recording:
-                log.warning("Cannot apply settings while recording")
-                return
             was_live = True
             self.stop_live()
             time.sleep(self.timeout)
 
         try:
-            settings = self.window.settings.get_settings()
-
-            # Build camera settings dict
-            cam_settings = {}
-
-            # ROI settings - handle in correct order
-            offset_x = self._snap_roi_offset(settings["roi"]["offset_x"])
-            offset_y = self._snap_roi_offset(settings["roi"]["offset_y"])
-
-            if offset_x != 0 or offset_y != 0:
+            if cam_settings["OffsetX"] != 0 or cam_settings["OffsetY"] != 0:
                 self.camera.set_parameter("OffsetX", 0)
                 self.camera.set_parameter("OffsetY", 0)
 
-            cam_settings["Width"] = settings["roi"]["width"]
-            cam_settings["Height"] = (
-                1 if self.waterfall_mode else settings["roi"]["height"]
-            )
-            cam_settings["OffsetX"] = offset_x
-            cam_settings["OffsetY"] = offset_y
-
-            # Only apply binning if supported
-            if self.window.settings.binning_horizontal.isEnabled():
-                cam_settings["BinningHorizontal"] = settings["roi"]["binning_h"]
-                cam_settings["BinningVertical"] = settings["roi"]["binning_v"]
-
-            # Acquisition settings
-            cam_settings["ExposureTime"] = settings["acquisition"]["exposure"]
-            cam_settings["Gain"] = settings["acquisition"]["gain"]
-            cam_settings["PixelFormat"] = settings["acquisition"]["pixel_format"]
-
-            # Only apply sensor mode if supported
-            if (
-                settings["acquisition"]["sensor_mode"]
-                and self.window.settings.sensor_mode.isEnabled()
-            ):
-                cam_settings["SensorReadoutMode"] = settings["acquisition"][
-                    "sensor_mode"
-                ]
-
-            # Frame rate settings - only if supported
-            if self.window.settings.framerate_enable.isEnabled():
-                if settings["framerate"]["enabled"]:
-                    cam_settings["AcquisitionFrameRateEnable"] = True
-                    cam_settings["AcquisitionFrameRate"] = settings["framerate"]["fps"]
-                else:
-                    cam_settings["AcquisitionFrameRateEnable"] = False
-
-            # Throughput settings - only if supported
-            if self.window.settings.throughput_enable.isEnabled():
-                if settings["framerate"]["throughput_enabled"]:
-                    cam_settings["DeviceLinkThroughputLimitMode"] = "On"
-                    cam_settings["DeviceLinkThroughputLimit"] = int(
-                        settings["framerate"]["throughput_limit"] * 1000000
-                    )
-                else:
-                    cam_settings["DeviceLinkThroughputLimitMode"] = "Off"
-
             # Apply all settings
-            self.camera.apply_settings(cam_settings)
+            # Remember the snapshot only if the camera took every value
+            if self.camera.apply_settings(cam_settings):
+                self._last_applied = snapshot
+            else:
+                self._last_applied = None
 
             # Update ROI display
             self.window.preview.update_status(
@@ -533,6 +542,7 @@ class PylonApp:
             log.debug("Camera settings applied")
 
         except Exception as e:
+            self._last_applied = None
             log.error(f"Failed to apply settings: {e}")
 
         finally:
@@ -590,35 +600,29 @@ class PylonApp:
             path = f"{base_path}/{img_prefix}{suffix}_{timestamp}.png"
             Path(path).parent.mkdir(parents=True, exist_ok=True)
 
-            # Save frame
-            h, w = frame.shape[:2]
+            # Save frame as 8-bit
             if frame.dtype == np.uint16:
-                frame = (frame >> 8).astype(np.uint8)
+                # Keep the top 8 significant bits (Mono10/12 are not 16-bit full scale)
+                frame = kernels.shift_to_u8(
+                    frame,
+                    np.empty(frame.shape, dtype=np.uint8),
+                    kernels.u8_shift(self.pixel_bits),
+                )
 
             if not frame.flags["C_CONTIGUOUS"]:
                 frame = np.ascontiguousarray(frame)
 
-            if len(frame.shape) == 2:
-                img = QImage(
-                    frame.data, w, h, w, QImage.Format.Format_Grayscale8
-                )
-            else:
-                img = QImage(
-                    frame.data, w, h, w * 3, QImage.Format.Format_RGB888
-                )
+            transformed = (
+                settings["transform"]["flip_x"]
+                or settings["transform"]["flip_y"]
+                or settings["transform"]["rotation"] != 0
+            )
+            kind = "Waterfall" if self.waterfall_mode else "Frame"
 
-            if img.save(path):
-                log.info(
-                    f"{'Waterfall' if self.waterfall_mode else 'Frame'} captured: {path}"
-                )
-                if (
-                    settings["transform"]["flip_x"]
-                    or settings["transform"]["flip_y"]
-                    or settings["transform"]["rotation"] != 0
-                ):
-                    log.info("(Transform applied to saved image)")
-            else:
-                log.error("Failed to save frame")
+            # Encode off the GUI thread, the frame is not modified afterwards
+            self._save_pool.submit(
+                _save_png, frame, path, kind, transformed, self.pixel_bgr
+            )
         else:
             log.error("No frame available")
 
@@ -641,6 +645,7 @@ class PylonApp:
         # Configure preview
         if settings["capture"]["preview_off"]:
             self.thread.set_preview_enabled(False)
+            self.window.preview.set_preview_enabled(False)
             if self.waterfall_mode:
                 self.window.preview.show_message(
                     "Recording Waterfall...\n(Preview disabled)"
@@ -669,6 +674,7 @@ class PylonApp:
                 str(base_path),
                 settings["capture"]["video_prefix"],
                 w, h, settings["capture"]["video_fps"],
+                bit_depth=self.pixel_bits,
             )
 
         # Start recording with limits
@@ -696,6 +702,7 @@ class PylonApp:
 
             # Re-enable preview
             self.thread.set_preview_enabled(True)
+            self.window.preview.set_preview_enabled(True)
 
             if self.waterfall_mode:
                 log.info(f"Waterfall recording stopped: {frames} lines")
@@ -717,6 +724,9 @@ class PylonApp:
     def _on_offset_x_changed(self, value):
         """Handle X offset slider change"""
         value = self._snap_roi_offset(value)
+        # Slider steps inside the same snap bucket change nothing
+        if value == self.window.settings.roi_offset_x.value():
+            return
         if self.camera.device:
             # Update camera immediately
             self.camera.set_parameter("OffsetX", value)
@@ -726,6 +736,9 @@ class PylonApp:
     def _on_offset_y_changed(self, value):
         """Handle Y offset slider change"""
         value = self._snap_roi_offset(value)
+        # Slider steps inside the same snap bucket change nothing
+        if value == self.window.settings.roi_offset_y.value():
+            return
         if self.camera.device:
             # Update camera immediately
             self.camera.set_parameter("OffsetY", value)
@@ -753,6 +766,35 @@ def check_dependencies():
     return missing
 
 
+def _save_png(
+    frame: np.ndarray, path: str, kind: str, transformed: bool, bgr: bool = False
+):
+    """Encode an 8-bit frame as PNG, runs on the capture save thread"""
+    # Nobody waits on the future, so failures must be logged here
+    try:
+        h, w = frame.shape[:2]
+        if len(frame.shape) == 2:
+            img = QImage(frame.data, w, h, w, QImage.Format.Format_Grayscale8)
+        elif bgr:
+            # Native channel order, Qt converts once while encoding
+            img = QImage(frame.data, w, h, w * 3, QImage.Format.Format_BGR888)
+        else:
+            img = QImage(frame.data, w, h, w * 3, QImage.Format.Format_RGB888)
+
+        if img.save(path, "PNG", CAPTURE_PNG_QUALITY):
+            log.info(f"{kind} captured: {path}")
+            if transformed:
+                log.info("(Transform applied to saved image)")
+        else:
+            log.error("Failed to save frame")
+    except Exception as e:
+        log.error(f"Failed to save frame: {e}")
+
+
+def _process_signals():
+    """No-op slot that hands control back to Python for signal handling"""
+
+
 def main():
     """Main entry point"""
     app = ui.create_app("PylonGuy", sys.argv)
@@ -784,10 +826,10 @@ def main():
 
     # Timer to allow Python to process signals during Qt event loop
     signal_timer = QTimer()
-    signal_timer.timeout.connect(lambda: None)
+    signal_timer.timeout.connect(_process_signals)
     signal_timer.start(SIGNAL_TIMER_INTERVAL_MS)
 
-    app.aboutToQuit.connect(lambda: pylon_app.disconnect_camera())
+    app.aboutToQuit.connect(pylon_app.disconnect_camera)
 
     sys.exit(app.exec())
 
@@ -28,10 +28,11 @@ class CameraThread(QThread):
         self._frame_pending = Event()
         self.writer = None
 
-        # Stats
+        # Stats, timestamps in monotonic nanoseconds
         self.frame_count = 0
-        self.start_time = 0
-        self.last_stats_time = 0
+        self.grab_count = 0  # all grabbed frames, read by the GUI for FPS
+        self.start_ns = 0
+        self.last_stats_ns = 0
 
         # Limits
         self.max_frames = None
@@ -43,7 +44,8 @@ class CameraThread(QThread):
     def run(self):
         """Simple acquisition loop"""
         self._stop_event.clear()
-        self.last_stats_time = time.time()
+        self.last_stats_ns = time.monotonic_ns()
+        stats_interval_ns = int(STATS_UPDATE_INTERVAL * 1e9)
 
         log.debug(
             f"Thread - Acquisition thread started (waterfall_mode={self.waterfall_mode})"
@@ -56,36 +58,45 @@ class CameraThread(QThread):
             frame = self.camera.grab_frame()
 
             if frame is not None:
+                self.grab_count += 1
+
                 # Handle recording
                 if self._recording_event.is_set() and self.writer:
                     if self.writer.write(frame):
                         self.frame_count += 1
 
-                        # Check limits periodically (every 100 frames/lines)
-                        if self.frame_count % LIMIT_CHECK_INTERVAL == 0:
-                            if self._check_limits():
-                                self.recording_stopped.emit()
-                                self.stop_recording()
-                                break
+                        # Frame limit is a plain counter compare, time limit
+                        # only needs checking periodically (every 100 frames/lines)
+                        if self._check_limits(
+                            self.frame_count % LIMIT_CHECK_INTERVAL == 0
+                        ):
+                            self.recording_stopped.emit()
+                            self.stop_recording()
+                            break
 
                 if self.preview_enabled and not self._frame_pending.is_set():
                     self._frame_pending.set()
                     self.frame_ready.emit(frame)
 
                 # Update stats periodically
-                current_time = time.time()
-                if current_time - self.last_stats_time >= STATS_UPDATE_INTERVAL:
-                    self.last_stats_time = current_time
+                now_ns = time.monotonic_ns()
+                if now_ns - self.last_stats_ns >= stats_interval_ns:
+                    self.last_stats_ns = now_ns
                     recording = self._recording_event.is_set()
                     stats = {
                         "recording": recording,
                         "frames": self.frame_count if recording else 0,
-                        "elapsed": current_time - self.start_time
-                        if recording
-                        else 0,
+                        "elapsed": (now_ns - self.start_ns) / 1e9 if recording else 0,
                     }
                     self.stats_update.emit(stats)
             else:
+                # Time limit must still fire while the camera delivers nothing
+                if self._recording_event.is_set() and self.max_time:
+                    if self._check_limits():
+                        self.recording_stopped.emit()
+                        self.stop_recording()
+                        break
+
                 # Small sleep if no frame available
                 self.msleep(1)
 
@@ -98,7 +109,7 @@ class CameraThread(QThread):
         self.max_frames = max_frames
         self.max_time = max_time
         self.frame_count = 0
-        self.start_time = time.time()
+        self.start_ns = time.monotonic_ns()
 
         if self.writer.start():
             # Switch to OneByOne strategy to preserve all frames
@@ -159,7 +170,7 @@ class CameraThread(QThread):
         """Called by main thread after frame is displayed"""
         self._frame_pending.clear()
 
-    def _check_limits(self) -> bool:
+    def _check_limits(self, check_time: bool = True) -> bool:
         """Check if recording limits reached"""
         if self.max_frames and self.frame_count >= self.max_frames:
             log.debug(
@@ -167,8 +178,8 @@ class CameraThread(QThread):
             )
             return True
 
-        if self.max_time:
-            elapsed = time.time() - self.start_time
+        if check_time and self.max_time:
+            elapsed = (time.monotonic_ns() - self.start_ns) / 1e9
             if elapsed >= self.max_time:
                 log.debug(f"Thread - Time limit reached: {self.max_time}s")
                 return True
@@ -1,27 +1,41 @@
 """Log widget - Application logging display"""
 
 import dropletui as ui
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QTimer, Signal
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QTextEdit,
 )
+from collections import deque
 from pathlib import Path
+from threading import Lock
 import logging
 import time
 
+from ..constants import LOG_FLUSH_INTERVAL_MS, LOG_MAX_BLOCKS, LOG_MAX_LINES
+
 log = logging.getLogger("pylonguy")
 
 
 class LogWidget(QWidget):
     """Log display widget with controls"""
 
-    append_text = Signal(str)
+    append_text = Signal()  # new lines are pending
 
     def __init__(self):
         super().__init__()
-        self.log_content = []
+        self.log_content = deque(maxlen=LOG_MAX_LINES)
+        self._logs_dir_ready = False
+
+        # Lines queued from any thread, flushed to the view in batches
+        self._pending = []
+        self._pending_lock = Lock()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
         self.init_ui()
 
     def init_ui(self):
@@ -51,21 +65,37 @@ class LogWidget(QWidget):
         # Log display
         self.log = QTextEdit()
         self.log.setReadOnly(True)
+        # Let the document drop its oldest lines, bounds reflow and memory
+        self.log.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         layout.addWidget(self.log)
 
         self.setLayout(layout)
 
-        self.append_text.connect(self._append_text_safe)
+        self.append_text.connect(self._schedule_flush)
 
     def add(self, message: str):
         """Add message to log"""
         self.log_content.append(message)
-        self.append_text.emit(message)
-
-    def _append_text_safe(self, message: str):
-        """Append text in UI thread"""
+        with self._pending_lock:
+            self._pending.append(message)
+            first = len(self._pending) == 1
+        if first:
+            self.append_text.emit()
+
+    def _schedule_flush(self):
+        """Start the flush timer in UI thread unless already pending"""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Append pending lines in one go"""
+        with self._pending_lock:
+            if not self._pending:
+                return
+            text = "\n".join(self._pending)
+            self._pending.clear()
         try:
-            self.log.append(message)
+            self.log.append(text)
             scrollbar = self.log.verticalScrollBar()
             scrollbar.setValue(scrollbar.maximum())
         except Exception:
@@ -73,8 +103,10 @@ class LogWidget(QWidget):
 
     def clear_log(self):
         """Clear the log display and content"""
+        with self._pending_lock:
+            self._pending.clear()
         self.log.clear()
-        self.log_content = []
+        self.log_content.clear()
 
     def save_log(self):
         """Save log content to file"""
@@ -82,13 +114,20 @@ class LogWidget(QWidget):
         filename = f"log_{timestamp}.log"
 
         try:
-            Path("./logs").mkdir(exist_ok=True)
-            filepath = Path("./logs") / filename
-
-            with open(filepath, "w") as f:
-                f.write("\n".join(self.log_content))
+            logs_dir = Path("./logs")
+            if not self._logs_dir_ready:
+                logs_dir.mkdir(exist_ok=True)
+                self._logs_dir_ready = True
+            filepath = logs_dir / filename
+
+            # Snapshot in one C-level copy, other threads keep appending
+            lines = list(self.log_content)
+            with open(
+                filepath, "w", buffering=1 << 20, encoding="utf-8", newline="\n"
+            ) as f:
+                f.writelines(f"{line}\n" for line in lines)
 
             # Note: This will only appear if INFO level is selected
-            logging.getLogger("pylonguy").info(f"Log saved to {filepath}")
+            log.info(f"Log saved to {filepath}")
         except Exception as e:
-            logging.getLogger("pylonguy").error(f"Failed to save log: {e}")
+            log.error(f"Failed to save log: {e}")
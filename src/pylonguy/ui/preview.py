@@ -1,8 +1,17 @@
 """Preview widget - Camera display with zero-copy rendering"""
 
 import dropletui as ui
-from PySide6.QtCore import QRect, Qt, Signal
-from PySide6.QtGui import QColor, QImage, QPainter, QPen, QTransform
+from PySide6.QtCore import QRect, Qt, QTimer, Signal
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QImage,
+    QPainter,
+    QPen,
+    QPixmap,
+    QRegion,
+    QTransform,
+)
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,6 +19,10 @@ from PySide6.QtWidgets import (
 )
 import numpy as np
 import logging
+import time
+
+from ..constants import PREVIEW_MAX_FPS, SELECTION_REDRAW_INTERVAL_MS
+from ..kernels import pixel_bit_depth, shift_to_u8, u8_shift
 
 log = logging.getLogger("pylonguy")
 
@@ -24,16 +37,45 @@ class PreviewDisplay(QWidget):
 
         # Frame data
         self.current_frame = None  # numpy array reference only
+        self._qimage = None  # QImage view over current_frame
+        self._frame_buf = None  # reusable buffer for non-contiguous frames
+        self._u8_buf = None  # reusable buffer for narrowed 10/12-bit frames
+        # Per pixel format, chosen once in set_pixel_format
+        self.shift = 8  # right shift keeping the top 8 bits of uint16 frames
+        self.narrow = False  # show uint16 frames as 8-bit instead of Grayscale16
+        self.bgr = False  # colour frames are in camera-native BGR order
+        self._frame_seq = 0  # bumped on every new frame
+
+        # Scaled pixmap reused by repaints that bring no new frame
+        self._scaled = None
+        self._scaled_key = None
 
         # Geometry
         self.frame_rect = QRect()
+        self._frame_rect_key = None  # (widget w, widget h, frame w, frame h)
 
         # Selection state
         self.selection_rect = None
+        self._selection_overlay = None  # (origin, QPixmap) of finished selection
         self.selecting = False
         self.select_start = None
         self.mouse_pos = None
 
+        # Overlay drawing tools, built once
+        self._sel_pen = QPen(QColor(0, 180, 255), 2, Qt.PenStyle.DashLine)
+        self._sel_pen.setDashPattern([5, 3])
+        self._sel_brush = QBrush(QColor(0, 120, 255, 30))
+        self._ruler_pen = QPen(QColor(255, 255, 0, 180), 1, Qt.PenStyle.SolidLine)
+        self._label_pen = QPen(QColor(255, 255, 0), 1)
+        self._label_shadow_pen = QPen(QColor(0, 0, 0), 2)
+
+        # Coalesce drag repaints to display rate
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(SELECTION_REDRAW_INTERVAL_MS)
+        self._redraw_timer.timeout.connect(self._redrawDrag)
+        self._drag_rect = QRect()  # last painted in-progress selection
+
         # Waterfall state
         self.waterfall_buffer = None
         self.waterfall_row = 0
@@ -51,6 +93,8 @@ class PreviewDisplay(QWidget):
         self.message = ""
 
         self.setMouseTracking(True)
+        # paintEvent covers every pixel, Qt need not erase the background first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
 
     def setFrame(self, frame: np.ndarray):
         """Frame update - returns False if buffer needs reinitialization"""
@@ -60,9 +104,9 @@ class PreviewDisplay(QWidget):
         if self.waterfall_mode and self.waterfall_buffer is not None:
             # Extract line from frame
             if len(frame.shape) == 2:
-                line = frame[0, :].astype(np.uint8)
+                line = frame[0, :]
             elif len(frame.shape) == 1:
-                line = frame.astype(np.uint8)
+                line = frame
             else:
                 return True
 
@@ -75,17 +119,21 @@ class PreviewDisplay(QWidget):
                 self.waterfall_row = 0
                 return False  # Signal reinit needed
 
-            # Add to buffer
-            self.waterfall_buffer[self.waterfall_row] = line
+            # Convert straight into the ring buffer row, no temporaries
+            row = self.waterfall_buffer[self.waterfall_row]
+            if line.dtype == np.uint16:
+                np.right_shift(line, self.shift, out=row, casting="unsafe")
+            else:
+                row[:] = line
             self.waterfall_row = (self.waterfall_row + 1) % self.waterfall_buffer.shape[
                 0
             ]
 
             # Prepare display array
             if self.waterfall_row == 0:
-                self.current_frame = self.waterfall_buffer
+                display = self.waterfall_buffer
             else:
-                self.current_frame = np.vstack(
+                display = np.vstack(
                     [
                         self.waterfall_buffer[self.waterfall_row :],
                         self.waterfall_buffer[: self.waterfall_row],
@@ -93,141 +141,215 @@ class PreviewDisplay(QWidget):
                 )
         else:
             # Normal mode
-            if frame.dtype == np.uint16:
-                frame = (frame >> 8).astype(np.uint8)
-            self.current_frame = frame
-
+            display = self._contiguous(frame)
+            # Colour is wrapped as 8-bit RGB888, so 16-bit colour always narrows
+            if display.dtype == np.uint16 and (self.narrow or display.ndim == 3):
+                display = self._narrow(display)
+
+        # Same geometry as the last painted frame: only the frame area is dirty
+        partial = (
+            self.current_frame is not None
+            and self.current_frame.shape == display.shape
+            and not self.message
+            and not self._isTransformed()
+            and not self.frame_rect.isEmpty()
+        )
+        # Reusable buffers were refilled in place, their QImage view is still valid
+        if self._qimage is None or display is not self.current_frame:
+            self._qimage = self._wrapImage(display)
+        self.current_frame = display
+        self._frame_seq += 1
         self.message = ""
-        self.update()
+
+        if partial:
+            self.update(self.frame_rect)
+        else:
+            self.update()
         return True
 
+    def _contiguous(self, frame: np.ndarray) -> np.ndarray:
+        """Return frame C-contiguous, copying into the reusable buffer if needed"""
+        if frame.flags["C_CONTIGUOUS"]:
+            return frame
+
+        buf = self._frame_buf
+        if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+            buf = self._frame_buf = np.empty(frame.shape, dtype=frame.dtype)
+        np.copyto(buf, frame)
+        return buf
+
+    def _narrow(self, frame: np.ndarray) -> np.ndarray:
+        """Scale a 10/12-bit frame to 8 bits in the reusable buffer"""
+        buf = self._u8_buf
+        if buf is None or buf.shape != frame.shape:
+            buf = self._u8_buf = np.empty(frame.shape, dtype=np.uint8)
+        return shift_to_u8(frame, buf, self.shift)
+
+    def _wrapImage(self, array: np.ndarray) -> QImage:
+        """Wrap a contiguous array in a QImage without copying"""
+        h, w = array.shape[:2]
+        if len(array.shape) == 2:
+            if array.dtype == np.uint16:
+                # 16-bit grayscale is consumed natively, no downshift pass
+                return QImage(
+                    array.data, w, h, w * 2, QImage.Format.Format_Grayscale16
+                )
+            # Grayscale
+            return QImage(array.data, w, h, w, QImage.Format.Format_Grayscale8)
+        # Colour, consumed in the camera's channel order without a swap pass
+        if self.bgr:
+            return QImage(array.data, w, h, w * 3, QImage.Format.Format_BGR888)
+        return QImage(array.data, w, h, w * 3, QImage.Format.Format_RGB888)
+
     def showMessage(self, text: str):
         """Show text message"""
         self.message = text
         self.current_frame = None
+        self._qimage = None
+        self._scaled = None
+        self._scaled_key = None
         self.update()
 
     def paintEvent(self, event):
         """Frame painting"""
         painter = QPainter(self)
 
-        # Always clear background
-        painter.fillRect(self.rect(), Qt.GlobalColor.black)
-
         # Draw message if set
         if self.message:
+            painter.fillRect(self.rect(), Qt.GlobalColor.black)
             painter.setPen(Qt.GlobalColor.white)
             painter.drawText(
                 self.rect(), Qt.AlignmentFlag.AlignCenter, self.message
             )
             return
 
-        # Draw frame if available
-        if self.current_frame is not None:
-            # Create QImage wrapper every time
-            h, w = self.current_frame.shape[:2]
-
-            if len(self.current_frame.shape) == 2:
-                # Grayscale
-                qimage = QImage(
-                    self.current_frame.data,
-                    w,
-                    h,
-                    w,
-                    QImage.Format.Format_Grayscale8,
-                )
-            else:
-                # RGB
-                qimage = QImage(
-                    self.current_frame.data,
-                    w,
-                    h,
-                    w * 3,
-                    QImage.Format.Format_RGB888,
-                )
+        if self.current_frame is None:
+            painter.fillRect(self.rect(), Qt.GlobalColor.black)
+            return
 
-            # Calculate display rectangle
-            widget_rect = self.rect()
-            scale_x = widget_rect.width() / w if w > 0 else 1
-            scale_y = widget_rect.height() / h if h > 0 else 1
-            scale = min(scale_x, scale_y)
-
-            final_w = int(w * scale)
-            final_h = int(h * scale)
-            x = (widget_rect.width() - final_w) // 2
-            y = (widget_rect.height() - final_h) // 2
-
-            self.frame_rect = QRect(x, y, final_w, final_h)
-
-            # Apply transforms if needed
-            if self.flip_x or self.flip_y or self.rotation != 0:
-                painter.save()
-                painter.translate(self.frame_rect.center())
-
-                transform = QTransform()
-                if self.rotation != 0:
-                    transform.rotate(self.rotation)
-                if self.flip_x:
-                    transform.scale(-1, 1)
-                if self.flip_y:
-                    transform.scale(1, -1)
-
-                painter.setTransform(transform, True)
-
-                offset_rect = QRect(
-                    -self.frame_rect.width() // 2,
-                    -self.frame_rect.height() // 2,
-                    self.frame_rect.width(),
-                    self.frame_rect.height(),
-                )
+        h, w = self.current_frame.shape[:2]
 
-                # Scale and draw the image
-                scaled_image = qimage.scaled(
-                    self.frame_rect.width(),
-                    self.frame_rect.height(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.FastTransformation,
-                )
-                painter.drawImage(offset_rect, scaled_image)
-                painter.restore()
-            else:
-                # Scale and draw directly
-                scaled_image = qimage.scaled(
-                    self.frame_rect.width(),
-                    self.frame_rect.height(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.FastTransformation,
-                )
-                painter.drawImage(self.frame_rect, scaled_image)
+        # Display rectangle only depends on widget and frame size
+        key = (self.width(), self.height(), w, h)
+        if key != self._frame_rect_key:
+            self.frame_rect = self._calculateFrameRect(w, h)
+            self._frame_rect_key = key
+        scaled = self._scaledPixmap(self.frame_rect.width(), self.frame_rect.height())
+
+        # Apply transforms if needed
+        if self._isTransformed():
+            painter.fillRect(event.rect(), Qt.GlobalColor.black)
+            painter.save()
+            painter.translate(self.frame_rect.center())
+
+            transform = QTransform()
+            if self.rotation != 0:
+                transform.rotate(self.rotation)
+            if self.flip_x:
+                transform.scale(-1, 1)
+            if self.flip_y:
+                transform.scale(1, -1)
+
+            painter.setTransform(transform, True)
+
+            offset_rect = QRect(
+                -self.frame_rect.width() // 2,
+                -self.frame_rect.height() // 2,
+                self.frame_rect.width(),
+                self.frame_rect.height(),
+            )
 
-            # Draw overlays
-            self._drawOverlays(painter)
+            painter.drawPixmap(offset_rect, scaled)
+            painter.restore()
+        else:
+            # Only the letterbox margins need clearing, the frame covers the rest
+            painter.setClipRegion(
+                QRegion(event.rect()).subtracted(QRegion(self.frame_rect))
+            )
+            painter.fillRect(event.rect(), Qt.GlobalColor.black)
+            painter.setClipping(False)
+
+            painter.drawPixmap(self.frame_rect.topLeft(), scaled)
+
+        # Draw overlays
+        self._drawOverlays(painter)
+
+    def _calculateFrameRect(self, w: int, h: int) -> QRect:
+        """Aspect-preserving rectangle centered in the widget"""
+        widget_rect = self.rect()
+        scale_x = widget_rect.width() / w if w > 0 else 1
+        scale_y = widget_rect.height() / h if h > 0 else 1
+        scale = min(scale_x, scale_y)
+
+        final_w = int(w * scale)
+        final_h = int(h * scale)
+        x = (widget_rect.width() - final_w) // 2
+        y = (widget_rect.height() - final_h) // 2
+        return QRect(x, y, final_w, final_h)
+
+    def _scaledPixmap(self, width: int, height: int) -> QPixmap:
+        """Scaled pixmap of the current frame, rebuilt only when stale"""
+        key = (self._frame_seq, width, height)
+        if key != self._scaled_key:
+            image = self._qimage.scaled(
+                width,
+                height,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.FastTransformation,
+            )
+            # Drawn about once before the next frame, skip the format conversion
+            flags = Qt.ImageConversionFlag.NoFormatConversion
+            # Refill the existing pixmap in place while the frame size holds
+            if self._scaled is not None and self._scaled.size() == image.size():
+                self._scaled.convertFromImage(image, flags)
+            else:
+                self._scaled = QPixmap.fromImage(image, flags)
+            self._scaled_key = key
+        return self._scaled
+
+    def _isTransformed(self) -> bool:
+        """Check if any preview transform is active"""
+        return self.flip_x or self.flip_y or self.rotation != 0
+
+    def _drawSelection(self, painter, rect: QRect):
+        """Draw the dashed selection rectangle"""
+        painter.setPen(self._sel_pen)
+        painter.setBrush(self._sel_brush)
+        painter.drawRect(rect)
+
+    def _selectionOverlay(self):
+        """Finished selection pre-rendered once, returned with its origin"""
+        if self._selection_overlay is None:
+            bounds = self.selection_rect.adjusted(-2, -2, 2, 2)
+            dpr = self.devicePixelRatioF()
+            overlay = QPixmap(bounds.size() * dpr)
+            overlay.setDevicePixelRatio(dpr)
+            overlay.fill(Qt.GlobalColor.transparent)
+
+            painter = QPainter(overlay)
+            painter.translate(-bounds.topLeft())
+            self._drawSelection(painter, self.selection_rect)
+            painter.end()
+
+            self._selection_overlay = (bounds.topLeft(), overlay)
+        return self._selection_overlay
 
     def _drawOverlays(self, painter):
         """Draw selection, rulers, and indicators"""
 
         # Draw selection
-        if self.selection_rect or (
-            self.selecting and self.select_start and self.mouse_pos
-        ):
-            pen = QPen(QColor(0, 180, 255), 2, Qt.PenStyle.DashLine)
-            pen.setDashPattern([5, 3])
-            painter.setPen(pen)
-            painter.setBrush(QColor(0, 120, 255, 30))
-
-            if self.selection_rect:
-                painter.drawRect(self.selection_rect)
-            else:
-                temp_rect = QRect(self.select_start, self.mouse_pos).normalized()
-                painter.drawRect(temp_rect)
+        if self.selection_rect:
+            origin, overlay = self._selectionOverlay()
+            painter.drawPixmap(origin, overlay)
+        elif self.selecting and self.select_start and self.mouse_pos:
+            temp_rect = QRect(self.select_start, self.mouse_pos).normalized()
+            self._drawSelection(painter, temp_rect)
 
         # Draw rulers only if frame rect is valid
         if (
             self.ruler_v or self.ruler_h or self.ruler_radial
         ) and not self.frame_rect.isEmpty():
-            painter.setPen(
-                QPen(QColor(255, 255, 0, 180), 1, Qt.PenStyle.SolidLine)
-            )
+            painter.setPen(self._ruler_pen)
 
             cx = self.frame_rect.center().x()
             cy = self.frame_rect.center().y()
@@ -279,7 +401,7 @@ class PreviewDisplay(QWidget):
                     y_label = cy - label_radius * math.sin(radian)
 
                     label_text = f"{angle}°"
-                    painter.setPen(QPen(QColor(0, 0, 0), 2))
+                    painter.setPen(self._label_shadow_pen)
                     painter.drawText(
                         int(x_label - 15),
                         int(y_label - 5),
@@ -288,7 +410,7 @@ class PreviewDisplay(QWidget):
                         Qt.AlignmentFlag.AlignCenter,
                         label_text,
                     )
-                    painter.setPen(QPen(QColor(255, 255, 0), 1))
+                    painter.setPen(self._label_pen)
                     painter.drawText(
                         int(x_label - 14),
                         int(y_label - 6),
@@ -307,7 +429,7 @@ class PreviewDisplay(QWidget):
                 transform_text.append("FlipY")
             if self.rotation != 0:
                 transform_text.append(f"Rot{self.rotation}°")
-            painter.setPen(QColor(255, 255, 0))
+            painter.setPen(self._label_pen)
             painter.drawText(10, 20, " ".join(transform_text) + " (preview only)")
 
     def mousePressEvent(self, event):
@@ -316,12 +438,23 @@ class PreviewDisplay(QWidget):
             self.select_start = event.position().toPoint()
             self.selecting = True
             self.selection_rect = None
+            self._drag_rect = QRect()
+        self._selection_overlay = None
 
     def mouseMoveEvent(self, event):
         """Track selection"""
         self.mouse_pos = event.position().toPoint()
-        if self.selecting:
-            self.update()
+        if self.selecting and not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _redrawDrag(self):
+        """Repaint only the area swept by the in-progress selection"""
+        if not (self.selecting and self.select_start and self.mouse_pos):
+            return
+        rect = QRect(self.select_start, self.mouse_pos).normalized()
+        dirty = rect.united(self._drag_rect) if self._drag_rect.isValid() else rect
+        self._drag_rect = rect
+        self.update(dirty.adjusted(-2, -2, 2, 2))
 
     def mouseReleaseEvent(self, event):
         """Finish selection"""
@@ -335,6 +468,7 @@ class PreviewDisplay(QWidget):
                 self.selection_rect = QRect(
                     self.select_start, self.mouse_pos
                 ).normalized()
+                self._selection_overlay = None
                 if self.selection_rect.isValid() and self.selection_rect.width() > 5:
                     pixel_rect = self._mapToFrameCoords(self.selection_rect)
                     self.selection_changed.emit(pixel_rect)
@@ -367,6 +501,7 @@ class PreviewDisplay(QWidget):
     def clearSelection(self):
         """Clear selection"""
         self.selection_rect = None
+        self._selection_overlay = None
         self.selecting = False
         self.select_start = None
         self.mouse_pos = None
@@ -398,6 +533,7 @@ class PreviewControls(QWidget):
 
     def __init__(self):
         super().__init__()
+        self._values = {}  # last text shown per status label
         self.init_ui()
 
     def _create_status_section(self, label_text: str, initial_value: str = "0"):
@@ -445,31 +581,34 @@ class PreviewControls(QWidget):
 
         self.setLayout(layout)
 
+    def _setValue(self, label, text: str):
+        """Set label text only when it changed, sparing a relayout/repaint"""
+        if self._values.get(label) != text:
+            self._values[label] = text
+            label.setText(text)
+
     def updateStatus(self, **kwargs):
         """Update status displays"""
         if "fps" in kwargs:
-            self.fps_value.setText(f" {kwargs['fps']:.1f} ")
+            self._setValue(self.fps_value, f" {kwargs['fps']:.1f} ")
 
         if "recording" in kwargs:
-            if kwargs["recording"]:
-                self.rec_status.setText(" ON ")
-            else:
-                self.rec_status.setText(" OFF ")
+            self._setValue(self.rec_status, " ON " if kwargs["recording"] else " OFF ")
 
         if "frames" in kwargs:
-            self.rec_frames.setText(f" {kwargs['frames']} ")
+            self._setValue(self.rec_frames, f" {kwargs['frames']} ")
 
         if "elapsed" in kwargs:
-            self.rec_time.setText(f" {kwargs['elapsed']:.1f}s ")
+            self._setValue(self.rec_time, f" {kwargs['elapsed']:.1f}s ")
 
         if "roi" in kwargs:
-            self.roi_value.setText(f" {kwargs['roi']} ")
+            self._setValue(self.roi_value, f" {kwargs['roi']} ")
 
         if "selection" in kwargs:
             if kwargs["selection"]:
-                self.sel_value.setText(f" {kwargs['selection']} ")
+                self._setValue(self.sel_value, f" {kwargs['selection']} ")
             else:
-                self.sel_value.setText(" None ")
+                self._setValue(self.sel_value, " None ")
 
     def setWaterfallMode(self, enabled: bool):
         """Update labels for waterfall mode"""
@@ -487,6 +626,9 @@ class PreviewWidget(QWidget):
 
     def __init__(self):
         super().__init__()
+        self._preview_enabled = True
+        self._last_paint_ns = 0
+        self._min_interval_ns = 1_000_000_000 // PREVIEW_MAX_FPS
         self.init_ui()
 
     def init_ui(self):
@@ -522,8 +664,35 @@ class PreviewWidget(QWidget):
     # Public interface methods
     def show_frame(self, frame: np.ndarray):
         """Display frame with zero copy"""
+        if not self._preview_enabled:
+            return True
+
+        # Drop frames arriving faster than the display can show them;
+        # waterfall lines are never dropped, each one is a row of the image
+        now = time.monotonic_ns()
+        if not self.display.waterfall_mode:
+            if now - self._last_paint_ns < self._min_interval_ns:
+                return True
+        self._last_paint_ns = now
         return self.display.setFrame(frame)
 
+    def set_preview_fps(self, fps: float):
+        """Set maximum preview refresh rate"""
+        self._min_interval_ns = int(1_000_000_000 / fps) if fps > 0 else 0
+
+    def set_pixel_format(self, pixel_format: str):
+        """Set bit depth and channel order of incoming frames"""
+        bits = pixel_bit_depth(pixel_format)
+        self.display.shift = u8_shift(bits)
+        # 10/12-bit frames would look near-black as Grayscale16
+        self.display.narrow = 8 < bits < 16
+        self.display.bgr = pixel_format.startswith("BGR")
+        self.display._qimage = None
+
+    def set_preview_enabled(self, enabled: bool):
+        """Enable or disable frame display (e.g. while recording)"""
+        self._preview_enabled = enabled
+
     def show_message(self, message: str):
         """Show text message"""
         self.display.showMessage(message)
@@ -545,6 +714,8 @@ class PreviewWidget(QWidget):
         self.display.flip_x = flip_x
         self.display.flip_y = flip_y
         self.display.rotation = rotation
+        # Rotated frames and the transform label may cover the letterbox
+        self.display.update()
 
     def set_rulers(self, v: bool, h: bool, radial: bool):
         """Set ruler display"""
@@ -560,7 +731,7 @@ class PreviewWidget(QWidget):
     def clear_selection(self):
         """Clear selection"""
         self.display.clearSelection()
-        self.controls.sel_value.setText(" None ")
+        self.controls.updateStatus(selection=None)
         self.selection_changed.emit(None)
 
     def get_selection(self) -> QRect:
@@ -574,7 +745,7 @@ class PreviewWidget(QWidget):
     def _on_selection_changed(self, rect):
         """Handle selection change from display"""
         if rect and rect.isValid():
-            self.controls.sel_value.setText(f" {rect.width()}x{rect.height()} ")
+            self.controls.updateStatus(selection=f"{rect.width()}x{rect.height()}")
         else:
-            self.controls.sel_value.setText(" None ")
+            self.controls.updateStatus(selection=None)
         self.selection_changed.emit(rect)
@@ -1,14 +1,16 @@
 """Settings widget - Camera controls and presets"""
 
 import dropletui as ui
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, QSignalBlocker
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout,
-    QComboBox, QSpinBox, QDoubleSpinBox,
+    QComboBox, QSpinBox, QDoubleSpinBox, QAbstractSpinBox,
     QScrollArea,
 )
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
@@ -22,6 +24,25 @@ from ..constants import (
 
 log = logging.getLogger("pylonguy")
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def _load_json(data: bytes):
+    """Parse JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize JSON with 2-space indent, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
 
 class SettingsWidget(QWidget):
     """Settings panel with all controls"""
@@ -37,10 +58,13 @@ class SettingsWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.presets = {}
-        self._applying_preset = False
+        self._settings_cache = None  # get_settings() result until a control changes
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="presets")
         self.init_ui()
         self._init_param_widgets()
-        self.init_presets()
+        self._connect_settings_cache()
+        # Load presets once the event loop runs so disk I/O doesn't delay the window
+        QTimer.singleShot(0, self.init_presets)
 
     def _init_param_widgets(self):
         """Initialize parameter-to-widget mapping after UI creation."""
@@ -57,14 +81,21 @@ class SettingsWidget(QWidget):
             "PixelFormat": self.pixel_format,
             "SensorReadoutMode": self.sensor_mode,
         }
-        # Widgets that need special handling for disable (tuples)
+        # Widgets disabled together when a parameter is unsupported
         self._param_widgets_disable = {
-            "SensorReadoutMode": self.sensor_mode,
-            "BinningHorizontal": self.binning_horizontal,
-            "BinningVertical": self.binning_vertical,
+            "SensorReadoutMode": (self.sensor_mode,),
+            "BinningHorizontal": (self.binning_horizontal,),
+            "BinningVertical": (self.binning_vertical,),
             "AcquisitionFrameRate": (self.framerate_enable, self.framerate),
             "DeviceLinkThroughputLimit": (self.throughput_enable, self.throughput_limit),
         }
+        # Combo boxes populated from camera symbolics, with {option: index}
+        # of the last applied options
+        self._param_options = {
+            "PixelFormat": self.pixel_format,
+            "SensorReadoutMode": self.sensor_mode,
+        }
+        self._param_options_index = {}
 
     def init_presets(self):
         """Initialize preset configurations from JSON file"""
@@ -117,9 +148,8 @@ class SettingsWidget(QWidget):
 
         if preset_file.exists():
             try:
-                with open(preset_file, "r") as f:
-                    self.presets = json.load(f)
-                    log.info("Loaded presets from file")
+                self.presets = _load_json(preset_file.read_bytes())
+                log.info("Loaded presets from file")
             except Exception as e:
                 log.error(f"Failed to load presets: {e}")
                 self.presets = default_presets
@@ -135,10 +165,23 @@ class SettingsWidget(QWidget):
                 self.preset_combo.addItem(preset)
 
     def _save_presets_to_file(self):
-        """Save all presets to JSON file"""
+        """Save all presets to JSON file in the background"""
+        try:
+            payload = _dump_json(self.presets)
+        except Exception as e:
+            log.error(f"Failed to save presets: {e}")
+            return
+        # Single worker keeps saves in submission order
+        self._io_pool.submit(self._write_presets, payload)
+
+    @staticmethod
+    def _write_presets(payload: bytes):
+        """Write serialized presets (runs on the I/O worker)"""
         try:
-            with open("presets.json", "w") as f:
-                json.dump(self.presets, f, indent=2)
+            # Write aside and swap in, so a crash never leaves a truncated file
+            tmp = Path("presets.json.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, "presets.json")
             log.debug("Saved presets to file")
         except Exception as e:
             log.error(f"Failed to save presets: {e}")
@@ -175,33 +218,33 @@ class SettingsWidget(QWidget):
         }
 
         # Save to presets dict
+        is_new = preset_name not in self.presets
         self.presets[preset_name] = preset
 
         # Save to file
         self._save_presets_to_file()
 
-        # Update combo box if new preset
-        if self.preset_combo.findText(preset_name) < 0:
-            self.preset_combo.addItem(preset_name)
-            # Re-sort items
-            items = [
-                self.preset_combo.itemText(i) for i in range(self.preset_combo.count())
-            ]
-            items.sort()
-            self.preset_combo.clear()
-            self.preset_combo.addItems(items)
+        # Update combo box if new preset, sorted from the dict not the widget
+        if is_new:
+            with QSignalBlocker(self.preset_combo):
+                self.preset_combo.clear()
+                self.preset_combo.addItems(sorted(self.presets))
 
         # Clear input field
         self.preset_name_input.clear()
         log.info(f"Saved preset: {preset_name}")
 
     def init_ui(self):
+        # Hold repaints while the form rows are added in bulk
+        self.setUpdatesEnabled(False)
+
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
         content = QWidget()
+        content.setUpdatesEnabled(False)
         layout = QVBoxLayout()
 
         # Connection controls
@@ -261,14 +304,18 @@ class SettingsWidget(QWidget):
             step=OFFSET_SLIDER_STEP,
             page_step=OFFSET_SLIDER_STEP,
         )
-        self.offset_x_slider.valueChanged.connect(self.offset_x_changed.emit)
+        self.offset_x_slider.valueChanged.connect(
+            self.offset_x_changed.emit, type=Qt.ConnectionType.DirectConnection
+        )
 
         self.offset_y_slider = ui.slider(
             maximum=MAX_OFFSET_Y,
             step=OFFSET_SLIDER_STEP,
             page_step=OFFSET_SLIDER_STEP,
         )
-        self.offset_y_slider.valueChanged.connect(self.offset_y_changed.emit)
+        self.offset_y_slider.valueChanged.connect(
+            self.offset_y_changed.emit, type=Qt.ConnectionType.DirectConnection
+        )
 
         roi_layout.addRow("Width:", self.roi_width)
         roi_layout.addRow("Height:", self.roi_height)
@@ -295,6 +342,9 @@ class SettingsWidget(QWidget):
         self.flip_x_check = ui.check_box("X")
         self.flip_y_check = ui.check_box("Y")
         self.rotation_spin = ui.combo_box(["0", "90", "180", "270"])
+        # Keep each angle as item data so readers don't parse the text
+        for i in range(self.rotation_spin.count()):
+            self.rotation_spin.setItemData(i, int(self.rotation_spin.itemText(i)))
 
         roi_layout.addRow(
             "Transform:",
@@ -401,53 +451,95 @@ class SettingsWidget(QWidget):
 
         layout.addStretch()
         content.setLayout(layout)
+
+        # Emit once on Enter/focus-out instead of on every keystroke
+        for box in content.findChildren(QAbstractSpinBox):
+            box.setKeyboardTracking(False)
+
+        content.setUpdatesEnabled(True)
         scroll.setWidget(content)
 
         main_layout = QVBoxLayout()
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
+        self.setUpdatesEnabled(True)
 
     def _connect_settings(self):
         """Connect only ROI, Acquisition, and Frame Rate controls"""
-        # ROI section
-        self.roi_width.valueChanged.connect(self._emit_if_not_preset)
-        self.roi_height.valueChanged.connect(self._emit_if_not_preset)
-        self.roi_offset_x.valueChanged.connect(self._emit_if_not_preset)
-        self.roi_offset_y.valueChanged.connect(self._emit_if_not_preset)
-        self.binning_horizontal.currentIndexChanged.connect(self._emit_if_not_preset)
-        self.binning_vertical.currentIndexChanged.connect(self._emit_if_not_preset)
-
-        # Acquisition section
-        self.exposure.valueChanged.connect(self._emit_if_not_preset)
-        self.gain.valueChanged.connect(self._emit_if_not_preset)
-        self.pixel_format.currentTextChanged.connect(self._emit_if_not_preset)
-        self.sensor_mode.currentTextChanged.connect(self._emit_if_not_preset)
-
-        # Frame Rate Control section
-        self.framerate_enable.toggled.connect(self._emit_if_not_preset)
-        self.framerate.valueChanged.connect(self._emit_if_not_preset)
-        self.throughput_enable.toggled.connect(self._emit_if_not_preset)
-        self.throughput_limit.valueChanged.connect(self._emit_if_not_preset)
-
-    def _emit_if_not_preset(self):
-        """Only emit if not applying preset"""
-        if not self._applying_preset:
-            self.camera_settings_changed.emit()
+        # All emitters live in the GUI thread, skip AutoConnection's thread check
+        signals = (
+            # ROI section
+            self.roi_width.valueChanged,
+            self.roi_height.valueChanged,
+            self.roi_offset_x.valueChanged,
+            self.roi_offset_y.valueChanged,
+            self.binning_horizontal.currentIndexChanged,
+            self.binning_vertical.currentIndexChanged,
+            # Acquisition section
+            self.exposure.valueChanged,
+            self.gain.valueChanged,
+            self.pixel_format.currentTextChanged,
+            self.sensor_mode.currentTextChanged,
+            # Frame Rate Control section
+            self.framerate_enable.toggled,
+            self.framerate.valueChanged,
+            self.throughput_enable.toggled,
+            self.throughput_limit.valueChanged,
+        )
+        for signal in signals:
+            signal.connect(
+                self._on_camera_control_changed, type=Qt.ConnectionType.DirectConnection
+            )
+
+    def _connect_settings_cache(self):
+        """Drop the cached settings whenever any reported control changes"""
+        signals = (
+            self.capture_mode.currentTextChanged,
+            self.output_path.textChanged,
+            self.image_prefix.textChanged,
+            self.video_prefix.textChanged,
+            self.video_fps.valueChanged,
+            self.preview_off.toggled,
+            self.limit_frames_enable.toggled,
+            self.limit_frames.valueChanged,
+            self.limit_time_enable.toggled,
+            self.limit_time.valueChanged,
+            self.flip_x_check.toggled,
+            self.flip_y_check.toggled,
+            self.rotation_spin.currentIndexChanged,
+        )
+        for signal in signals:
+            signal.connect(
+                self._invalidate_settings, type=Qt.ConnectionType.DirectConnection
+            )
+
+    def _invalidate_settings(self):
+        """Force the next get_settings() to read the controls"""
+        self._settings_cache = None
+
+    def _on_camera_control_changed(self):
+        """Forward a camera control edit"""
+        # Camera controls invalidate here, before any consumer reads settings
+        self._settings_cache = None
+        self.camera_settings_changed.emit()
 
     def setLocked(self, locked: bool):
         """Lock all controls during recording"""
         self.setEnabled(not locked)
+        self._settings_cache = None  # disabled controls report defaults
 
     def _on_mode_changed(self, mode: str):
         """Handle capture mode change"""
+        self._settings_cache = None
         self.mode_changed.emit(mode)
 
     def _on_transform_changed(self):
         """Handle transform settings change"""
+        self._settings_cache = None
         self.transform_changed.emit(
             self.flip_x_check.isChecked(),
             self.flip_y_check.isChecked(),
-            int(self.rotation_spin.currentText()),
+            self.rotation_spin.currentData(),
         )
 
     def _on_ruler_changed(self):
@@ -462,13 +554,15 @@ class SettingsWidget(QWidget):
         """Apply selected preset"""
         preset_name = self.preset_combo.currentText()
         if preset_name in self.presets:
-            self._applying_preset = True
-
             preset = self.presets[preset_name]
             for param_name, value in preset.items():
-                self.set_parameter_value(param_name, value)
-
-            self._applying_preset = False
+                widget = self._param_widgets.get(param_name)
+                if widget is None:
+                    continue
+                # Silence per-widget signals, the batch is announced once below
+                with QSignalBlocker(widget):
+                    self.set_parameter_value(param_name, value)
+            self._settings_cache = None
 
             log.info(f"Applied preset: {preset_name}")
             self.camera_settings_changed.emit()
@@ -485,39 +579,58 @@ class SettingsWidget(QWidget):
                 if inc is not None:
                     widget.setSingleStep(inc)
 
-        if param_name == "PixelFormat" and options:
-            self.pixel_format.clear()
-            self.pixel_format.addItems(options)
-        elif param_name == "SensorReadoutMode" and options:
-            self.sensor_mode.clear()
-            self.sensor_mode.addItems(options)
+        combo = self._param_options.get(param_name)
+        if combo is not None and options:
+            options = list(options)
+            # Rebuild items only when the camera reports a different set
+            if list(self._param_options_index.get(param_name, ())) != options:
+                combo.clear()
+                combo.addItems(options)
+                self._param_options_index[param_name] = {
+                    option: i for i, option in enumerate(options)
+                }
 
     def set_parameter_value(self, param_name: str, value):
         """Set a parameter value from app.py"""
-        if param_name in self._param_widgets:
-            widget = self._param_widgets[param_name]
-            if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                widget.setValue(value)
-            elif isinstance(widget, QComboBox):
+        widget = self._param_widgets.get(param_name)
+        if widget is None:
+            return
+
+        if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+            widget.setValue(value)
+        elif isinstance(widget, QComboBox):
+            option_index = self._param_options_index.get(param_name)
+            if option_index is not None:
+                index = option_index.get(str(value), -1)
+            else:
                 index = widget.findText(str(value))
-                if index >= 0:
-                    widget.setCurrentIndex(index)
+            if index >= 0:
+                widget.setCurrentIndex(index)
 
     def disable_parameter(self, param_name: str):
         """Disable a parameter that doesn't exist in camera"""
-        if param_name in self._param_widgets_disable:
-            widget = self._param_widgets_disable[param_name]
-            if isinstance(widget, tuple):
-                for w in widget:
-                    w.setEnabled(False)
-                    w.setToolTip(f"{param_name} not supported by this camera")
-            else:
-                widget.setEnabled(False)
-                widget.setToolTip(f"{param_name} not supported by this camera")
-            log.debug(f"UI - Disabled {param_name} - not available in camera")
+        widgets = self._param_widgets_disable.get(param_name)
+        if widgets is None:
+            return
+
+        tooltip = f"{param_name} not supported by this camera"
+        for widget in widgets:
+            widget.setEnabled(False)
+            widget.setToolTip(tooltip)
+        self._settings_cache = None
+        log.debug(f"UI - Disabled {param_name} - not available in camera")
 
     def get_settings(self) -> dict:
         """Get all settings as dictionary"""
+        if self._settings_cache is None:
+            self._settings_cache = self._read_settings()
+        # Callers get their own copy of each section
+        return {
+            section: dict(values) for section, values in self._settings_cache.items()
+        }
+
+    def _read_settings(self) -> dict:
+        """Read all settings from the controls"""
         return {
             "roi": {
                 "width": self.roi_width.value(),
@@ -564,6 +677,6 @@ class SettingsWidget(QWidget):
             "transform": {
                 "flip_x": self.flip_x_check.isChecked(),
                 "flip_y": self.flip_y_check.isChecked(),
-                "rotation": int(self.rotation_spin.currentText()),
+                "rotation": self.rotation_spin.currentData(),
             },
         }
@@ -4,12 +4,14 @@ import shutil
 import subprocess
 import tempfile
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from queue import Queue, Empty, Full
 from threading import Thread, Event
 import logging
 import time
 
+from .kernels import shift_to_u8, u8_shift
 from .constants import WRITER_QUEUE_SIZE, WRITER_THREAD_TIMEOUT, QUEUE_GET_TIMEOUT
 
 log = logging.getLogger("pylonguy")
@@ -18,12 +20,21 @@ log = logging.getLogger("pylonguy")
 class VideoWorker:
     """Frame writer that dumps frames to temp dir then creates video"""
 
-    def __init__(self, output_dir: str, prefix: str, width: int, height: int, fps: float):
+    def __init__(
+        self,
+        output_dir: str,
+        prefix: str,
+        width: int,
+        height: int,
+        fps: float,
+        bit_depth: int = 16,
+    ):
         self.output_dir = Path(output_dir)
         self.prefix = prefix
         self.width = width
         self.height = height
         self.fps = fps
+        self.shift = u8_shift(bit_depth)
 
         # Temp dir created on start(), cleaned up after ffmpeg
         self.frames_dir = None
@@ -34,6 +45,9 @@ class VideoWorker:
         self._stop_event = Event()
         self.frame_count = 0
 
+        # 8-bit output buffer reused by the writer thread
+        self._u8_buf = None
+
     def start(self) -> bool:
         """Start frame writer thread"""
         try:
@@ -99,14 +113,18 @@ class VideoWorker:
             try:
                 frame, idx = self.queue.get(timeout=QUEUE_GET_TIMEOUT)
 
-                # Convert 16-bit to 8-bit if needed
+                # Convert 16-bit to 8-bit if needed, in a single pass
                 if frame.dtype == np.uint16:
-                    frame = (frame >> 8).astype(np.uint8)
+                    if self._u8_buf is None or self._u8_buf.shape != frame.shape:
+                        self._u8_buf = np.empty(frame.shape, dtype=np.uint8)
+                    frame = shift_to_u8(frame, self._u8_buf, self.shift)
 
-                # Write raw bytes
+                # Write raw bytes straight from the array, no tobytes() copy
+                if not frame.flags["C_CONTIGUOUS"]:
+                    frame = np.ascontiguousarray(frame)
                 path = self.frames_dir / f"{idx:08d}.raw"
                 with open(path, "wb") as f:
-                    f.write(frame.tobytes())
+                    f.write(frame.data)
 
             except Empty:
                 continue
@@ -207,6 +225,9 @@ class WaterfallWorker:
         self.file = None
         self.active = False
 
+        # Blocks are written off the acquisition thread, in submission order
+        self._io_pool = None
+
     def start(self) -> bool:
         """Start waterfall writer"""
         try:
@@ -220,6 +241,9 @@ class WaterfallWorker:
             header = b"WTF1" + self.width.to_bytes(2, "little")
             self.file.write(header)
 
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="waterfall"
+            )
             self.active = True
             self.line_count = 0
 
@@ -255,19 +279,22 @@ class WaterfallWorker:
             return False
 
     def _flush_buffer(self):
-        """Write buffered lines to file"""
+        """Hand buffered lines to the writer thread"""
         if not self.buffer or not self.file:
             return
 
+        # Stack lines into one contiguous block, the file write happens off-thread
+        block = np.vstack(self.buffer)
+        self.buffer = []
+        self._io_pool.submit(self._write_block, block)
+
+    def _write_block(self, block: np.ndarray):
+        """Write one block of lines to file"""
         try:
-            # Stack lines and write as contiguous block
-            block = np.vstack(self.buffer)
-            self.file.write(block.tobytes())
+            self.file.write(block.data)
             self.file.flush()  # Ensure data is written
 
-            log.debug(f"Flushed {len(self.buffer)} lines to waterfall")
-            self.buffer = []
-
+            log.debug(f"Flushed {block.shape[0]} lines to waterfall")
         except Exception as e:
             log.error(f"Failed to flush waterfall buffer: {e}")
 
@@ -276,9 +303,12 @@ class WaterfallWorker:
         self.active = False
 
         try:
-            # Flush remaining buffer
+            # Flush remaining buffer and wait for pending writes
             if self.buffer:
                 self._flush_buffer()
+            if self._io_pool:
+                self._io_pool.shutdown(wait=True)
+                self._io_pool = None
         finally:
             # Always close file
             if self.file:
@@ -7,15 +7,20 @@ Usage:
     python wtf2png.py input.wtf                # Creates input.png
     python wtf2png.py input.wtf output.png      # Specify output name
     python wtf2png.py input.wtf --lines 480     # Split into multiple PNGs with 480 lines each
+    python wtf2png.py input.wtf --compress 1    # Faster encode, larger PNG
     python wtf2png.py *.wtf                     # Convert multiple files
     python wtf2png.py legacy.kmg                # Still works with old .kmg files
 """
 
 import argparse
+import mmap
+import os
 import numpy as np
 from pathlib import Path
 from PIL import Image
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 
 def read_waterfall_file(file_path: Path):
@@ -49,29 +54,32 @@ def read_waterfall_file(file_path: Path):
         else:
             raise ValueError(f"Invalid header: {magic}")
 
-        # Read data
-        data = f.read()
+        # Map the file so pixels are paged in on demand instead of copied
+        data_offset = f.tell()
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
     # Calculate dimensions
-    total_pixels = len(data)
+    total_pixels = len(data) - data_offset
     lines = total_pixels // width
 
     if total_pixels % width != 0:
         print(f"Warning: Data size not evenly divisible by width {width}")
 
-    # Reshape to 2D array
-    array = np.frombuffer(data, dtype=np.uint8, count=lines * width)
-    array = array.reshape((lines, width))
+    # 2D view straight onto the mapping, which stays alive through its base
+    array = np.ndarray((lines, width), dtype=np.uint8, buffer=data, offset=data_offset)
 
     print(f"Loaded {file_type}: {lines} lines × {width} pixels")
 
     return array
 
 
-def save_png(array: np.ndarray, output_path: Path):
+def save_png(array: np.ndarray, output_path: Path, compress_level: int = 6):
     """Save numpy array as PNG"""
-    image = Image.fromarray(array, mode="L")
-    image.save(output_path, "PNG")
+    # Wrap the (memory-mapped) rows without copying them into Pillow
+    array = np.ascontiguousarray(array)
+    height, width = array.shape
+    image = Image.frombuffer("L", (width, height), array, "raw", "L", 0, 1)
+    image.save(output_path, "PNG", compress_level=compress_level)
     print(f"Saved: {output_path}")
 
 
@@ -79,6 +87,7 @@ def convert_file(
     input_path: Path,
     output_path: Path = None,
     max_lines: int = None,
+    compress_level: int = 6,
 ):
     """Convert a single .wtf or .kmg file to PNG(s)"""
     if not input_path.exists():
@@ -94,7 +103,7 @@ def convert_file(
         if max_lines is None or total_lines <= max_lines:
             if output_path is None:
                 output_path = input_path.with_suffix(".png")
-            save_png(array, output_path)
+            save_png(array, output_path, compress_level)
         else:
             # Split into multiple files
             num_files = (total_lines + max_lines - 1) // max_lines  # Ceiling division
@@ -115,7 +124,7 @@ def convert_file(
                 # Generate filename with zero-padded index
                 chunk_path = base_dir / f"{base_name}_{i + 1:04d}.png"
 
-                save_png(chunk, chunk_path)
+                save_png(chunk, chunk_path, compress_level)
                 print(f"  Chunk {i + 1}/{num_files}: lines {start_line + 1}-{end_line}")
 
         return True
@@ -135,6 +144,15 @@ def main():
     parser.add_argument(
         "--lines", "-l", type=int, help="Max lines per PNG (splits into multiple files)"
     )
+    parser.add_argument(
+        "--compress",
+        "-c",
+        type=int,
+        default=6,
+        choices=range(10),
+        metavar="0-9",
+        help="PNG compression level, lower is faster (default: 6)",
+    )
 
     args = parser.parse_args()
 
@@ -162,16 +180,31 @@ def main():
     # Convert single file with specified output
     if len(input_files) == 1 and args.output and not args.lines:
         # Single file, output specified, no splitting
-        convert_file(input_files[0], Path(args.output), args.lines)
+        convert_file(input_files[0], Path(args.output), args.lines, args.compress)
     else:
         # Multiple files or splitting mode
         if args.output and len(input_files) > 1:
             print("Warning: Output name ignored for multiple files")
 
-        for input_file in input_files:
-            if input_file.suffix.lower() in [".wtf", ".kmg"]:
+        input_files = [f for f in input_files if f.suffix.lower() in [".wtf", ".kmg"]]
+        convert = partial(
+            convert_file,
+            output_path=None,
+            max_lines=args.lines,
+            compress_level=args.compress,
+        )
+
+        # Files are independent, encode them on separate cores
+        workers = min(len(input_files), os.cpu_count() or 1)
+        if workers <= 1:
+            for input_file in input_files:
                 print(f"\nConverting: {input_file}")
-                convert_file(input_file, None, args.lines)
+                convert(input_file)
+        else:
+            print(f"\nConverting {len(input_files)} files with {workers} workers")
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for input_file, ok in zip(input_files, pool.map(convert, input_files)):
+                    print(f"{'Converted' if ok else 'Failed'}: {input_file}")
 
 
 if __name__ == "__main__":